@@ -1,12 +1,13 @@
-import numpy as np
-from pathfinding.core.diagonal_movement import DiagonalMovement
-from pathfinding.core.grid import Grid
-from pathfinding.finder.a_star import AStarFinder
-
+from gupb.controller.botelka_ml.grid import Grid
 from gupb.controller.botelka_ml.state import State, weapon_ranking_by_desc
 from gupb.controller.botelka_ml.utils import debug_print
 from gupb.model.characters import Action, Facing
-from gupb.model.coordinates import sub_coords, Coords, add_coords
+from gupb.model.coordinates import Coords
+
+# Coordinate offsets of the four facings, in the order menhir surroundings are tried
+FACING_DELTAS = (Facing.UP.value, Facing.RIGHT.value, Facing.DOWN.value, Facing.LEFT.value)
+
+FACING_BY_DELTA = {facing.value: facing for facing in Facing}
 
 
 def go_to_menhir(grid: Grid, state: State) -> Action:
@@ -14,12 +15,8 @@ def go_to_menhir(grid: Grid, state: State) -> Action:
     Returns one step towards Menhir.
     """
     # We can not go to menhir directly because menhir itself is an obstacle.
-    menhir_surroundings = [
-        add_coords(state.menhir_coords, Facing.UP.value),
-        add_coords(state.menhir_coords, Facing.RIGHT.value),
-        add_coords(state.menhir_coords, Facing.DOWN.value),
-        add_coords(state.menhir_coords, Facing.LEFT.value),
-    ]
+    menhir_x, menhir_y = state.menhir_coords
+    menhir_surroundings = [Coords(menhir_x + dx, menhir_y + dy) for dx, dy in FACING_DELTAS]
 
     for menhir_surrounding in menhir_surroundings:
         if menhir_surrounding == state.bot_coords:
@@ -34,29 +31,21 @@ def go_to_menhir(grid: Grid, state: State) -> Action:
 
 
 def kill_them_all(grid: Grid, state: State) -> Action:
-    def coords_dist(coords_0, coords_1):
-        det = sub_coords(coords_0, coords_1)
-        return np.sqrt(det.x ** 2 + det.y ** 2)
-
-    attackable_players = [
-        (coord, coords_dist(state.bot_coords, coord))
-        for coord in state.weapon.cut_positions(state.arena.terrain, state.bot_coords, state.facing)
-        if coord in state.visible_enemies
-    ]
+    bot_x, bot_y = state.bot_coords
 
-    if attackable_players:
-        return Action.ATTACK
+    # Distances are only compared, so squared ones will do
+    def squared_dist_to_bot(coords):
+        dx, dy = coords[0] - bot_x, coords[1] - bot_y
+        return dx * dx + dy * dy
 
-    visible_enemies = [
-        (coord, coords_dist(state.bot_coords, coord))
-        for coord in state.visible_enemies
-    ]
+    # Cut positions are already checked against visible enemies once per tick in get_state
+    if state.can_attack_enemy:
+        return Action.ATTACK
 
-    if not visible_enemies:
+    if not state.visible_enemies:
         return Action.DO_NOTHING
 
-    # Closest enemy sorted by distance
-    closest_enemy_coords, closest_enemy_dist = sorted(visible_enemies, key=lambda x: x[1])[0]
+    closest_enemy_coords = min(state.visible_enemies, key=squared_dist_to_bot)
 
     return _go_to_coords(grid, state.bot_coords, state.facing, closest_enemy_coords)
 
@@ -90,14 +79,11 @@ def find_better_weapon(grid: Grid, state: State) -> Action:
 
 
 def flee(grid: Grid, state: State) -> Action:
-    enemies_in_one_line = [
-        enemy_coord
-        for enemy_coord in state.visible_enemies
-        if enemy_coord.x == state.bot_coords.x or enemy_coord.y == state.bot_coords.y
-    ]
+    bot_x, bot_y = state.bot_coords
 
-    if len(enemies_in_one_line):
-        return Action.TURN_RIGHT
+    for enemy_x, enemy_y in state.visible_enemies:
+        if enemy_x == bot_x or enemy_y == bot_y:
+            return Action.TURN_RIGHT
 
     return Action.STEP_FORWARD
 
@@ -106,31 +92,19 @@ def _go_to_coords(grid: Grid, bot_coords: Coords, bot_facing: Facing, destinatio
     if bot_coords == destination_coords:
         return Action.DO_NOTHING
 
-    finder = AStarFinder(diagonal_movement=DiagonalMovement.never)
-    grid.cleanup()
-
-    start = grid.node(bot_coords.x, bot_coords.y)
-    end = grid.node(destination_coords.x, destination_coords.y)
-
-    path, _ = finder.find_path(start, end, grid)
+    path = grid.find_path(bot_coords, destination_coords)
 
     if not path:
         return Action.DO_NOTHING
 
-    current_cords, next_coords = path[0], path[1]
-    desired_facing = Facing(sub_coords(next_coords, current_cords))
+    (current_x, current_y), (next_x, next_y) = path[0], path[1]
+    desired_facing = FACING_BY_DELTA[(next_x - current_x, next_y - current_y)]
 
     return Action.STEP_FORWARD if bot_facing == desired_facing else _choose_rotation(bot_facing, desired_facing)
 
 
 def _find_path_len(grid: Grid, bot_coords: Coords, destination_coords: Coords) -> int:
-    finder = AStarFinder(diagonal_movement=DiagonalMovement.never)
-    grid.cleanup()
-
-    start = grid.node(bot_coords.x, bot_coords.y)
-    end = grid.node(destination_coords.x, destination_coords.y)
-
-    path, _ = finder.find_path(start, end, grid)
+    path = grid.find_path(bot_coords, destination_coords)
 
     if not path:
         return -1
@@ -139,6 +113,10 @@ def _find_path_len(grid: Grid, bot_coords: Coords, destination_coords: Coords) -
 
 
 def _choose_rotation(current_facing: Facing, desired_facing: Facing) -> Action:
+    return ROTATIONS[(current_facing, desired_facing)]
+
+
+def _find_rotation(current_facing: Facing, desired_facing: Facing) -> Action:
     facing_left, facing_right = current_facing, current_facing
 
     while True:
@@ -151,3 +129,11 @@ def _choose_rotation(current_facing: Facing, desired_facing: Facing) -> Action:
 
         if facing_right == desired_facing:
             return Action.TURN_RIGHT
+
+
+# There are only 16 (current, desired) facing pairs, so resolve them all once on import
+ROTATIONS = {
+    (current_facing, desired_facing): _find_rotation(current_facing, desired_facing)
+    for current_facing in Facing
+    for desired_facing in Facing
+}
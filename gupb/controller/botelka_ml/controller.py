@@ -1,6 +1,5 @@
-from pathfinding.core.grid import Grid
-
 from gupb.controller.botelka_ml.actions import go_to_menhir, kill_them_all, find_better_weapon, flee
+from gupb.controller.botelka_ml.grid import Grid
 from gupb.controller.botelka_ml.utils import debug_print
 from gupb.controller.botelka_ml.state import State, get_state
 from gupb.model.arenas import ArenaDescription, Arena
@@ -78,7 +77,7 @@ class BotElkaController:
         self.prepare_grid()
 
         self.tick = 0
-        self.old_state = State(self.arena, Coords(0, 0), 5, [], False, Facing.UP, Knife(), 1000,
+        self.old_state = State(self.arena, Coords(0, 0), 5, [], False, Facing.UP, Knife(), 1000 ** 2,
                                self.arena.menhir_position, 0, {}, False)
 
         self.weapons_info = {
@@ -154,7 +153,7 @@ class BotElkaController:
         ]
         matrix[self.arena.menhir_position.y][self.arena.menhir_position.x] = 0
 
-        self.grid = Grid(matrix=matrix)
+        self.grid = Grid(matrix)
 
 
 def get_tile_cost(tile: Tile) -> int:
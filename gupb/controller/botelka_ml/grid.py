@@ -0,0 +1,113 @@
+import heapq
+from typing import Dict, List, Tuple
+
+from gupb.model.coordinates import Coords
+
+
+class Grid:
+    """
+    Arena movement costs, where 0 marks an obstacle.
+    """
+
+    def __init__(self, matrix: List[List[int]]):
+        self.height = len(matrix)
+        self.width = len(matrix[0]) if self.height else 0
+
+        # Flattened once per arena, cell (x, y) lives under index y * width + x
+        self.weights = [weight for row in matrix for weight in row]
+        self._xs = [x for _ in range(self.height) for x in range(self.width)]
+        self._ys = [y for y in range(self.height) for _ in range(self.width)]
+
+        # Walkable neighbours of every cell together with the cost of entering them,
+        # so the search loop does no bounds or obstacle checks
+        self._neighbours = [self._walkable_neighbours(index) for index in range(len(self.weights))]
+
+        # Search buffers are reused by every query, resetting them is a single slice copy
+        self._unreached = [-1] * len(self.weights)
+        self._costs = list(self._unreached)
+        self._parents = list(self._unreached)
+
+        # Paths from the last queried start, keyed by end. The bot asks for several targets from the
+        # cell it stands on, and once it moves the old paths are never asked for again.
+        self._paths_start = None
+        self._paths: Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]] = {}
+
+    def find_path(self, start: Coords, end: Coords) -> Tuple[Tuple[int, int], ...]:
+        """
+        Returns the cheapest path from start to end (both included) using A* with Manhattan heuristic,
+        or an empty tuple if end can not be reached.
+        """
+        start = (start[0], start[1])
+        if start != self._paths_start:
+            self._paths_start = start
+            self._paths.clear()
+
+        end = (end[0], end[1])
+        if end not in self._paths:
+            self._paths[end] = tuple(self._search(start, end))
+        return self._paths[end]
+
+    def _search(self, start: Coords, end: Coords) -> List[Tuple[int, int]]:
+        width, xs, ys, neighbours = self.width, self._xs, self._ys, self._neighbours
+        end_x, end_y = end
+        # Flat indices would silently wrap onto a neighbouring row, so cells off the grid are rejected up front
+        if not (0 <= end_x < width and 0 <= end_y < self.height):
+            return []
+
+        start_index = start[1] * width + start[0]
+        end_index = end_y * width + end_x
+
+        # Cheap checks settle some queries without searching at all
+        if start_index != end_index:
+            if self.weights[end_index] <= 0:
+                # Obstacles can never be entered, searching would only flood the whole reachable area
+                return []
+            if abs(start[0] - end_x) + abs(start[1] - end_y) == 1:
+                # Every weight is at least 1, so no detour beats stepping straight onto a neighbour
+                return [(start[0], start[1]), (end_x, end_y)]
+
+        # Parents are only read for reached cells, so only the costs need a reset
+        costs, parents = self._costs, self._parents
+        costs[:] = self._unreached
+        costs[start_index] = 0
+        parents[start_index] = -1
+        open_list = [(0, 0, start_index)]
+
+        while open_list:
+            _, cost, index = heapq.heappop(open_list)
+
+            if index == end_index:
+                path = []
+                while index != -1:
+                    path.append((xs[index], ys[index]))
+                    index = parents[index]
+                path.reverse()
+                return path
+
+            # Stale entry, the cell has been reached cheaper in the meantime
+            if cost > costs[index]:
+                continue
+
+            for neighbour, weight in neighbours[index]:
+                neighbour_cost = cost + weight
+                if costs[neighbour] == -1 or neighbour_cost < costs[neighbour]:
+                    costs[neighbour] = neighbour_cost
+                    parents[neighbour] = index
+                    heuristic = abs(xs[neighbour] - end_x) + abs(ys[neighbour] - end_y)
+                    heapq.heappush(open_list, (neighbour_cost + heuristic, neighbour_cost, neighbour))
+
+        return []
+
+    def _walkable_neighbours(self, index: int) -> List[Tuple[int, int]]:
+        x, y = self._xs[index], self._ys[index]
+        candidates = []
+        if y > 0:
+            candidates.append(index - self.width)
+        if x < self.width - 1:
+            candidates.append(index + 1)
+        if y < self.height - 1:
+            candidates.append(index + self.width)
+        if x > 0:
+            candidates.append(index - 1)
+
+        return [(neighbour, self.weights[neighbour]) for neighbour in candidates if self.weights[neighbour] > 0]
@@ -2,11 +2,9 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict
 
-import numpy as np
-
 from gupb.model.arenas import Arena
 from gupb.model.characters import ChampionKnowledge, Facing
-from gupb.model.coordinates import Coords, sub_coords
+from gupb.model.coordinates import Coords
 from gupb.model.weapons import Weapon, Axe, Sword, Amulet, Knife, Bow, WeaponDescription
 
 WEAPONS = {
@@ -17,14 +15,6 @@ WEAPONS = {
     "amulet": Amulet(),
 }
 
-WEAPON_TO_INT = {
-    "bow": 0,
-    "axe": 1,
-    "sword": 2,
-    "knife": 3,
-    "amulet": 4,
-}
-
 FACING_TO_INT = {
     Facing.UP: 0,
     Facing.RIGHT: 1,
@@ -32,19 +22,18 @@ FACING_TO_INT = {
     Facing.DOWN: 3
 }
 
+WEAPON_RANKING = {
+    "amulet": 10,
+    "bow": 8,
+    "axe": 6,
+    "sword": 6,
+}
+
 MAX_HEALTH = 5
 
 
 def weapon_ranking_by_desc(weapon: WeaponDescription) -> int:
-    if weapon.name == 'amulet':
-        return 10
-    if weapon.name == 'bow':
-        return 8
-    if weapon.name == 'axe':
-        return 6
-    if weapon.name == 'sword':
-        return 6
-    return 0
+    return WEAPON_RANKING.get(weapon.name, 0)
 
 
 class DistanceMeasure(Enum):
@@ -54,8 +43,15 @@ class DistanceMeasure(Enum):
     INACCESSIBLE = 3
 
 
-@dataclass
+@dataclass(frozen=True)
 class State:
+    # One State is built every tick, slots keep it small and its attribute access fast
+    __slots__ = (
+        "arena", "bot_coords", "health", "visible_enemies", "can_attack_enemy", "facing", "weapon",
+        "squared_distance_to_menhir", "menhir_coords", "tick", "weapons_info", "mist_visible",
+        "_tuple",
+    )
+
     arena: Arena
     bot_coords: Coords
     health: int
@@ -63,57 +59,67 @@ class State:
     can_attack_enemy: bool
     facing: Facing
     weapon: Weapon
-    distance_to_menhir: int
+    squared_distance_to_menhir: int
     menhir_coords: Coords
     tick: int
     weapons_info: Dict[Coords, WeaponDescription]
     mist_visible: bool
 
+    def __post_init__(self):
+        object.__setattr__(self, "_tuple", None)
+
     @staticmethod
     def get_length():
         return 11
 
     def as_tuple(self):
-        return (
-            hash(self.arena.name), self.bot_coords.x, self.bot_coords.y, self.health, len(self.visible_enemies),
-            self.can_attack_enemy, FACING_TO_INT[self.facing], self.distance_to_menhir, self.menhir_coords.x,
-            self.menhir_coords.y, self.tick
-        )
+        # State is never modified after creation, so the tuple is built at most once
+        if self._tuple is None:
+            object.__setattr__(self, "_tuple", (
+                hash(self.arena.name), self.bot_coords.x, self.bot_coords.y, self.health, len(self.visible_enemies),
+                self.can_attack_enemy, FACING_TO_INT[self.facing], self.squared_distance_to_menhir,
+                self.menhir_coords.x, self.menhir_coords.y, self.tick
+            ))
+        return self._tuple
 
 
 def get_state(knowledge: ChampionKnowledge, arena: Arena, tick: int,
               weapons_prior_info: Dict[Coords, WeaponDescription]) -> State:
+    visible_tiles = knowledge.visible_tiles
     bot_coords = knowledge.position
-    bot_tile = knowledge.visible_tiles.get(bot_coords)
+    bot_tile = visible_tiles.get(bot_coords)
     bot_character = bot_tile.character if bot_tile else None
-    bot_weapon = bot_character.weapon.name if bot_character else "knife"
+    bot_weapon = WEAPONS[bot_character.weapon.name if bot_character else "knife"]
     bot_facing = bot_character.facing if bot_character else Facing.UP
 
     # ---
 
     health = bot_character.health if bot_character else 5
 
-    visible_enemies = [
-        Coords(*coords)
-        for coords, tile in knowledge.visible_tiles.items()
-        if tile.character and coords != bot_coords
-    ]
-
-    can_attack_enemy = any(
-        coord
-        for coord in
-        WEAPONS[bot_weapon].cut_positions(arena.terrain, bot_coords, bot_facing)
-        if coord in knowledge.visible_tiles and knowledge.visible_tiles[coord].character
-    )
-
-    menhir_det = sub_coords(bot_coords, arena.menhir_position)
-    menhir_distance = np.sqrt(menhir_det.x ** 2 + menhir_det.y ** 2)
-
-    visible_weapons = {
-        Coords(*coords): tile.loot
-        for coords, tile in knowledge.visible_tiles.items()
-        if tile.loot and coords != bot_coords
-    }
+    cut_positions = frozenset(bot_weapon.cut_positions(arena.terrain, bot_coords, bot_facing))
+
+    # Everything derived from the visible tiles is gathered in a single pass
+    visible_enemies = []
+    visible_weapons = {}
+    can_attack_enemy = False
+    mist_visible = False
+    for coords, tile in visible_tiles.items():
+        if coords != bot_coords:
+            if tile.character:
+                visible_enemies.append(Coords(*coords))
+                can_attack_enemy = can_attack_enemy or coords in cut_positions
+            if tile.loot:
+                visible_weapons[Coords(*coords)] = tile.loot
+        if not mist_visible:
+            for effect in tile.effects:
+                if effect.type == "mist":
+                    mist_visible = True
+                    break
+
+    menhir_x, menhir_y = arena.menhir_position
+    menhir_dx, menhir_dy = bot_coords[0] - menhir_x, bot_coords[1] - menhir_y
+    # The model feature is the squared Euclidean distance, kept as an int without a square root
+    squared_menhir_distance = menhir_dx * menhir_dx + menhir_dy * menhir_dy
 
     old_weapons = {
         coords: weapon
@@ -125,12 +131,6 @@ def get_state(knowledge: ChampionKnowledge, arena: Arena, tick: int,
     if bot_coords in weapons:
         del weapons[bot_coords]
 
-    mist_visible = any(
-        visible_tile
-        for visible_tile in knowledge.visible_tiles.values()
-        if "mist" in {effect.type for effect in visible_tile.effects}
-    )
-
     return State(
         arena,
         bot_coords,
@@ -138,8 +138,8 @@ def get_state(knowledge: ChampionKnowledge, arena: Arena, tick: int,
         visible_enemies,
         can_attack_enemy,
         bot_facing,
-        WEAPONS[bot_weapon],
-        menhir_distance,
+        bot_weapon,
+        squared_menhir_distance,
         arena.menhir_position,
         tick,
         weapons,